@@ -8,7 +8,7 @@ import math
 import sys
 from threading import Timer
 import time
-from typing import Callable, DefaultDict, Dict, Set, Tuple
+from typing import Callable, DefaultDict, Dict, FrozenSet, Set, Tuple
 
 if sys.platform == 'win32':
     from pynput.keyboard import _win32 as keyboard
@@ -39,7 +39,8 @@ class App:
         Ui.configure()
         App.configure()
         Ui.start()
-        while Ui._keyboard_listener.is_alive() and Ui._mouse_listener.is_alive():
+        keyboard_listener, mouse_listener = Ui._keyboard_listener, Ui._mouse_listener
+        while keyboard_listener.is_alive() and mouse_listener.is_alive():
             time.sleep(.125)
     
     def configure():
@@ -56,6 +57,7 @@ class Ui:
     TOG = NOP + 3
     _MODS: Tuple[int] = (Key.shift.value.vk, Key.ctrl.value.vk, Key.alt.value.vk,
                          Key.cmd.value.vk, FN, SPEC, TOG)
+    _MOD_SET: FrozenSet[int] = frozenset(_MODS)
     # Config
     GRAVE = ONE = TWO = THREE = FOUR = FIVE = SIX = SEVEN = EIGHT = NINE = ZERO = DASH = NOP
     EQUAL = Q = W = E = R = T = Y = U = I = O = P = LEFT_SQUARE = RIGHT_SQUARE = NOP
@@ -154,7 +156,7 @@ class Ui:
         if specs:
             active_window_title = App.get_active_window_title()
             for keywords, sequence in specs:
-                if any(active_window_title.count(x) for x in keywords):
+                if any(x in active_window_title for x in keywords):
                     Ui.press_sequence(*sequence)
                     return
         Ui.press_sequence(*default)
@@ -174,9 +176,11 @@ class Ui:
         if should_release_stickies: Ui.release_stickies()
     
     def touch_mods(should_press: bool, out_mods: Set[int]):
+        pressed_mods, touch_key = Ui.pressed_mods, Ui.touch_key
         for mod in Ui._MODS:
-            if (mod in out_mods) != (mod in Ui.pressed_mods):
-                Ui.touch_key(should_press == (mod in out_mods), mod)
+            is_out_mod = mod in out_mods
+            if is_out_mod != (mod in pressed_mods):
+                touch_key(should_press == is_out_mod, mod)
     
     def touch_key(should_press: bool, out_key: int):
         if not Ui._is_virtual(out_key):
@@ -197,9 +201,9 @@ class Ui:
     def touch_button(should_press: bool, button: Button):
         if should_press:
             last_time, last_button, last_level = Ui._last_button_press
-            curr_time = time.time()
+            curr_time = time.monotonic()
             if (button == last_button and
-                    time.time() - last_time < Ui._MAX_DOUBLE_CLICK_INTERVAL):
+                    curr_time - last_time < Ui._MAX_DOUBLE_CLICK_INTERVAL):
                 level = last_level + 1
             else:
                 level = 1
@@ -226,7 +230,7 @@ class Ui:
         return key_obj.value.vk if isinstance(key_obj, Key) else key_obj.vk
     
     def _record_pressed_key(in_key, out_press_key, out_tap_key, is_sticky):
-        time_pressed = time.time()
+        time_pressed = time.monotonic()
         Ui._pressed_keys[in_key] = (time_pressed, out_press_key, out_tap_key, is_sticky)
         Ui._last_key_press = (time_pressed, in_key, out_press_key)
     
@@ -237,15 +241,16 @@ class Ui:
             Ui.stop()
             return
         is_repetition = in_key in Ui._pressed_keys or in_key == Ui._last_key_press[1]
-        if not is_repetition: Ui._last_key_press = (time.time(), in_key, -1)
+        if not is_repetition: Ui._last_key_press = (time.monotonic(), in_key, -1)
         
-        if (in_key in Ui._EXECUTION_LAYOUT or
-                in_key in Ui._FUNCTION_LAYOUT and Ui.FN in Ui.pressed_mods):
+        execute = Ui._EXECUTION_LAYOUT.get(in_key)
+        if execute is None and Ui.FN in Ui.pressed_mods:
+            execute = Ui._FUNCTION_LAYOUT.get(in_key)
+        if execute is not None:
             # Modifier, function, or other special key
-            active_layout = (Ui._EXECUTION_LAYOUT
-                             if in_key in Ui._EXECUTION_LAYOUT else Ui._FUNCTION_LAYOUT)
-            active_layout[in_key](is_repetition)
-        elif in_key in Ui._CHARACTER_LAYOUT[0] and not (Ui.pressed_mods - {Ui.SHIFT}):
+            execute(is_repetition)
+        elif (in_key in Ui._CHARACTER_LAYOUT[0] and
+              (not Ui.pressed_mods or Ui.pressed_mods == {Ui.SHIFT})):
             # Character
             Ui.press_char(in_key)
         else:
@@ -274,11 +279,11 @@ class Ui:
         
         if in_key not in Ui._pressed_keys: return
         time_pressed, out_press_key, out_tap_key, is_sticky = Ui._pressed_keys.pop(in_key)
-        time_released = time.time()
+        time_released = time.monotonic()
         # Whether this key was pressed and released without any other keyboard or mouse events
         # in between
         is_continuous = Ui._last_key_press[1] == in_key
-        if out_press_key in Ui._MODS: is_continuous |= Ui._last_key_press[2] in Ui._MODS
+        if out_press_key in Ui._MOD_SET: is_continuous |= Ui._last_key_press[2] in Ui._MOD_SET
         should_reset_last_press = is_continuous
         
         if Ui.pressed_stickies:
@@ -302,7 +307,7 @@ class Ui:
                   lambda: Ui._last_key_press[1] == last and Ui.release_stickies()).start()
         else:
             # Normal release
-            if out_press_key in Ui._MODS and Ui._pressed_count_by_mod[out_press_key] > 0:
+            if out_press_key in Ui._MOD_SET and Ui._pressed_count_by_mod[out_press_key] > 0:
                 Ui._pressed_count_by_mod[out_press_key] -= 1
                 if Ui._pressed_count_by_mod[out_press_key] == 0:
                     Ui.pressed_mods.remove(out_press_key)
@@ -329,7 +334,7 @@ class Ui:
         Ui.touch_button(is_press, button)
     
     def _handle_mouse_move(x, y):
-        print('Move x', x, 'y', y)
+        # print('Move x', x, 'y', y)
         pass
     
     def _handle_mouse_scroll(x, y, dx, dy):